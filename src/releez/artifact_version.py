@@ -2,13 +2,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import StrEnum
+from typing import TYPE_CHECKING
 
-from releez.cliff import GitCliff
 from releez.errors import (
     BuildNumberRequiredError,
     PrereleaseNumberRequiredError,
 )
-from releez.git_repo import open_repo
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 
 class ArtifactVersionScheme(StrEnum):
@@ -30,7 +32,7 @@ class PrereleaseType(StrEnum):
     rc = 'rc'
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArtifactVersionInput:
     """Inputs for computing an artifact version.
 
@@ -58,46 +60,58 @@ _PEP440_PRERELEASE_MARKERS: dict[PrereleaseType, str] = {
 }
 
 
-def compute_artifact_version(artifact_input: ArtifactVersionInput) -> str:
+def compute_artifact_version(
+    artifact_input: ArtifactVersionInput,
+    *,
+    resolve_next_version: Callable[[], str],
+) -> str:
     """Compute an artifact version string.
 
     Args:
         artifact_input: The inputs for computing the version.
+        resolve_next_version: Computes the next release version (e.g. via git-cliff)
+            when `version_override` is not set.
 
     Returns:
         The version string to apply to the artifact.
 
     Raises:
         BuildNumberRequiredError: If a prerelease build is missing a build number.
+        PrereleaseNumberRequiredError: If a prerelease build is missing a prerelease number.
         ReleezError: If git or git-cliff are unavailable, or git-cliff fails.
     """
-    next_version = artifact_input.version_override or _compute_next_version()
     if artifact_input.is_full_release:
-        return next_version
+        return _next_version(artifact_input, resolve_next_version)
 
-    if artifact_input.build_number is None:
+    # Validate before resolving so error paths never pay for git-cliff.
+    build_number = artifact_input.build_number
+    if build_number is None:
         raise BuildNumberRequiredError
-
-    prerelease_type = artifact_input.prerelease_type.value
     prerelease_number = artifact_input.prerelease_number
     if prerelease_number is None:
         raise PrereleaseNumberRequiredError
+
+    next_version = _next_version(artifact_input, resolve_next_version)
+    prerelease_type = artifact_input.prerelease_type.value
     if artifact_input.scheme == ArtifactVersionScheme.semver:
-        return f'{next_version}-{prerelease_type}{prerelease_number}+{artifact_input.build_number}'
+        return f'{next_version}-{prerelease_type}{prerelease_number}+{build_number}'
     if artifact_input.scheme == ArtifactVersionScheme.docker:
-        return f'{next_version}-{prerelease_type}{prerelease_number}-{artifact_input.build_number}'
+        return f'{next_version}-{prerelease_type}{prerelease_number}-{build_number}'
     return _pep440_version(
         next_version=next_version,
         prerelease_type=artifact_input.prerelease_type,
         prerelease_number=prerelease_number,
-        build_number=artifact_input.build_number,
+        build_number=build_number,
     )
 
 
-def _compute_next_version() -> str:
-    _, info = open_repo()
-    cliff = GitCliff(repo_root=info.root)
-    return cliff.compute_next_version(bump='auto')
+def _next_version(
+    artifact_input: ArtifactVersionInput,
+    resolve_next_version: Callable[[], str],
+) -> str:
+    if artifact_input.version_override is not None:
+        return artifact_input.version_override
+    return resolve_next_version()
 
 
 def _pep440_version(
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import functools
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated, NamedTuple
 
 import typer
+from typer.core import TyperGroup
+from typer.main import get_group
 
 from releez.artifact_version import (
     ArtifactVersionInput,
@@ -17,47 +19,58 @@ from releez.errors import (
     ChangelogFormatCommandRequiredError,
     ReleezError,
 )
-from releez.git_repo import create_tags, fetch, open_repo, push_tags
-from releez.release import StartReleaseInput, start_release
-from releez.settings import ReleezSettings
 from releez.version_tags import AliasVersions, compute_version_tags, select_tags
 
-app = typer.Typer(help='CLI tool for helping to manage release processes.')
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    import click
+
+
+class _LazyRootGroup(TyperGroup):
+    """Root group that converts a sub-app to Click only when it is resolved.
+
+    Building a Click group evaluates every command signature in it, so e.g.
+    `releez version artifact` never builds the `release` commands.
+    """
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        _ = ctx
+        return list(_SUB_APPS)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands and cmd_name in _SUB_APPS:
+            group = get_group(_SUB_APPS[cmd_name])
+            group.name = cmd_name
+            self.add_command(group)
+        return super().get_command(ctx, cmd_name)
+
+    def resolve_command(
+        self,
+        ctx: click.Context,
+        args: list[str],
+    ) -> tuple[str | None, click.Command | None, list[str]]:
+        if args and args[0] not in _SUB_APPS:
+            # Build everything so Typer can suggest close matches for typos.
+            for name in _SUB_APPS:
+                self.get_command(ctx, name)
+        return super().resolve_command(ctx, args)
+
+
+app = typer.Typer(
+    cls=_LazyRootGroup,
+    help='CLI tool for helping to manage release processes.',
+)
 release_app = typer.Typer(help='Release workflows (changelog + branch + PR).')
 version_app = typer.Typer(help='Version utilities for CI/artifacts.')
 
 
 @app.callback()
-def _root(ctx: typer.Context) -> None:
-    settings = ReleezSettings()
-    ctx.obj = settings
+def _root() -> None:
+    pass
 
-    default_map: dict[str, object] = {}
-    default_map['release'] = {
-        'start': {
-            'base': settings.base_branch,
-            'remote': settings.git_remote,
-            'labels': settings.pr_labels,
-            'title_prefix': settings.pr_title_prefix,
-            'changelog_path': settings.changelog_path,
-            'create_pr': settings.create_pr,
-            'run_changelog_format': settings.run_changelog_format,
-            'changelog_format_cmd': settings.hooks.changelog_format,
-        },
-        'tag': {
-            'remote': settings.git_remote,
-            'alias_versions': settings.alias_versions,
-        },
-        'preview': {
-            'alias_versions': settings.alias_versions,
-        },
-    }
-    default_map['version'] = {
-        'artifact': {
-            'alias_versions': settings.alias_versions,
-        },
-    }
 
+def _apply_default_map(ctx: typer.Context, default_map: dict[str, object]) -> None:
     if ctx.default_map is None:
         ctx.default_map = default_map
     else:
@@ -67,8 +80,53 @@ def _root(ctx: typer.Context) -> None:
         }
 
 
-@dataclass(frozen=True)
-class _VersionArtifactArgs:
+@release_app.callback()
+def _release_root(ctx: typer.Context) -> None:
+    from releez.settings import load_settings  # noqa: PLC0415
+
+    settings = load_settings()
+    ctx.obj = settings
+    _apply_default_map(
+        ctx,
+        {
+            'start': {
+                'base': settings.base_branch,
+                'remote': settings.git_remote,
+                'labels': settings.pr_labels,
+                'title_prefix': settings.pr_title_prefix,
+                'changelog_path': settings.changelog_path,
+                'create_pr': settings.create_pr,
+                'run_changelog_format': settings.run_changelog_format,
+                'changelog_format_cmd': settings.hooks.changelog_format,
+            },
+            'tag': {
+                'remote': settings.git_remote,
+                'alias_versions': settings.alias_versions,
+            },
+            'preview': {
+                'alias_versions': settings.alias_versions,
+            },
+        },
+    )
+
+
+@version_app.callback()
+def _version_root(ctx: typer.Context) -> None:
+    from releez.settings import load_settings  # noqa: PLC0415
+
+    settings = load_settings()
+    ctx.obj = settings
+    _apply_default_map(
+        ctx,
+        {
+            'artifact': {
+                'alias_versions': settings.alias_versions,
+            },
+        },
+    )
+
+
+class _VersionArtifactArgs(NamedTuple):
     """CLI arguments for the `version artifact` command."""
 
     scheme: ArtifactVersionScheme
@@ -128,22 +186,52 @@ def _emit_artifact_version_output(
         typer.echo(tag)
 
 
+@functools.lru_cache(maxsize=8)
+def _get_cliff(repo_root: Path) -> GitCliff:
+    """Return a shared `GitCliff` for the repo; instances hold no per-call state."""
+    return GitCliff(repo_root=repo_root)
+
+
+@functools.cache
 def _resolve_release_version(
     *,
     repo_root: Path,
     version_override: str | None,
 ) -> str:
-    """Resolve the release version, defaulting to git-cliff."""
+    """Resolve the release version, defaulting to git-cliff.
+
+    Memoized per `(repo_root, version_override)` so git-cliff runs at most once per
+    repository within a process, and persisted across processes while HEAD, tags and
+    the git-cliff config are unchanged.
+    """
     if version_override is not None:
         return version_override
-    cliff = GitCliff(repo_root=repo_root)
-    return cliff.compute_next_version(bump='auto')
+
+    from releez.next_version_cache import get_or_compute  # noqa: PLC0415
+
+    return get_or_compute(
+        repo_root=repo_root,
+        bump='auto',
+        compute=lambda: _get_cliff(repo_root).compute_next_version(bump='auto'),
+    )
+
+
+def _compute_next_version() -> str:
+    from releez.git_repo import open_repo  # noqa: PLC0415
+
+    _, info = open_repo()
+    return _resolve_release_version(repo_root=info.root, version_override=None)
 
 
 def _raise_changelog_format_command_required() -> None:
     raise ChangelogFormatCommandRequiredError
 
 
+def _parse_labels(labels: str) -> list[str]:
+    """Split comma-separated labels, dropping surrounding whitespace and empties."""
+    return [label for label in (part.strip() for part in labels.split(',')) if label]
+
+
 @release_app.command('start')
 def release_start(  # noqa: PLR0913
     *,
@@ -261,6 +349,8 @@ def release_start(  # noqa: PLR0913
     Raises:
         typer.Exit: If an error occurs during release processing.
     """
+    from releez.release import StartReleaseInput, start_release  # noqa: PLC0415
+
     try:
         if run_changelog_format and not changelog_format_cmd:
             _raise_changelog_format_command_required()
@@ -270,7 +360,7 @@ def release_start(  # noqa: PLR0913
             version_override=version_override,
             base_branch=base,
             remote_name=remote,
-            labels=labels.split(',') if labels else [],
+            labels=_parse_labels(labels),
             title_prefix=title_prefix,
             changelog_path=changelog_path,
             run_changelog_format=run_changelog_format,
@@ -367,7 +457,10 @@ def version_artifact(  # noqa: PLR0913
             build_number=build_number,
         )
         artifact_input = _build_artifact_version_input(args=artifact_args)
-        artifact_version = compute_artifact_version(artifact_input)
+        artifact_version = compute_artifact_version(
+            artifact_input,
+            resolve_next_version=_compute_next_version,
+        )
         _emit_artifact_version_output(
             artifact_version=artifact_version,
             scheme=scheme,
@@ -409,6 +502,8 @@ def release_tag(
     ] = 'origin',
 ) -> None:
     """Create git tag(s) for a release and push them."""
+    from releez.git_repo import create_tags, fetch, open_repo, push_refs  # noqa: PLC0415
+
     try:
         repo, _info = open_repo()
         fetch(repo, remote_name=remote)
@@ -422,16 +517,18 @@ def release_tag(
         alias_only_tags = selected[1:]
 
         create_tags(repo, tags=exact_tags, force=False)
-        push_tags(repo, remote_name=remote, tags=exact_tags, force=False)
 
+        # The exact tag must be new on the remote; aliases move. One atomic push
+        # leaves the aliases alone if the exact tag is rejected, and the local
+        # aliases only move once the remote accepted them.
+        push_refs(
+            repo,
+            remote_name=remote,
+            tags=exact_tags,
+            force_tags=alias_only_tags,
+        )
         if alias_only_tags:
             create_tags(repo, tags=alias_only_tags, force=True)
-            push_tags(
-                repo,
-                remote_name=remote,
-                tags=alias_only_tags,
-                force=True,
-            )
     except ReleezError as exc:
         typer.secho(str(exc), err=True, fg=typer.colors.RED)
         raise typer.Exit(code=1) from exc
@@ -440,6 +537,16 @@ def release_tag(
         typer.echo(tag)
 
 
+def _iter_preview_lines(*, version: str, tags: Iterable[str]) -> Iterator[str]:
+    yield '## `releez` release preview'
+    yield ''
+    yield f'- Version: `{version}`'
+    yield '- Tags:'
+    for tag in tags:
+        yield f'  - `{tag}`'
+    yield ''
+
+
 @release_app.command('preview')
 def release_preview(
     *,
@@ -470,6 +577,8 @@ def release_preview(
     ] = None,
 ) -> None:
     """Preview the version and tags that would be published."""
+    from releez.git_repo import open_repo  # noqa: PLC0415
+
     try:
         _repo, info = open_repo()
         version = _resolve_release_version(
@@ -480,20 +589,11 @@ def release_preview(
         computed = compute_version_tags(version=version)
         tags = select_tags(tags=computed, aliases=alias_versions)
 
-        markdown = '\n'.join(
-            [
-                '## `releez` release preview',
-                '',
-                f'- Version: `{version}`',
-                '- Tags:',
-                *[f'  - `{tag}`' for tag in tags],
-                '',
-            ],
-        )
+        markdown = '\n'.join(_iter_preview_lines(version=version, tags=tags))
 
         if output is not None:
             output_path = Path(output)
-            output_path.write_text(markdown, encoding='utf-8')
+            output_path.write_bytes(markdown.encode('utf-8'))
         else:
             typer.echo(markdown)
     except ReleezError as exc:
@@ -522,18 +622,19 @@ def release_notes(
     ] = None,
 ) -> None:
     """Generate the new changelog section for the release."""
+    from releez.git_repo import open_repo  # noqa: PLC0415
+
     try:
         _, info = open_repo()
-        version = _resolve_release_version(
-            repo_root=info.root,
-            version_override=version_override,
-        )
-        cliff = GitCliff(repo_root=info.root)
-        notes = cliff.generate_unreleased_notes(version=version)
+        cliff = _get_cliff(info.root)
+        if version_override is None:
+            notes = cliff.compute_version_and_notes(bump='auto').markdown
+        else:
+            notes = cliff.generate_unreleased_notes(version=version_override)
 
         if output is not None:
             output_path = Path(output)
-            output_path.write_text(notes, encoding='utf-8')
+            output_path.write_bytes(notes.encode('utf-8'))
         else:
             typer.echo(notes)
     except ReleezError as exc:
@@ -541,8 +642,10 @@ def release_notes(
         raise typer.Exit(code=1) from exc
 
 
-app.add_typer(release_app, name='release')
-app.add_typer(version_app, name='version')
+_SUB_APPS: dict[str, typer.Typer] = {
+    'release': release_app,
+    'version': version_app,
+}
 
 
 def main() -> None:
@@ -1,23 +1,34 @@
 from __future__ import annotations
 
+import functools
 import os
+import re
 import shutil
 import sysconfig
-import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from releez.errors import GitCliffVersionComputeError, MissingCliError
 from releez.process import run_checked
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 GIT_CLIFF_BIN = 'git-cliff'
 GIT_CLIFF_TAG_PATTERN = '^[0-9]+\\.[0-9]+\\.[0-9]+$'
 
 GitCliffBump = Literal['major', 'minor', 'patch', 'auto']
 
+# The release heading git-cliff renders, e.g. `## [2.3.4] - 2026-01-01`. The patch
+# number must be followed by `]`, whitespace, or the end of the line, so a
+# prerelease such as `1.2.3-rc.1` is not mistaken for `1.2.3`.
+_RELEASE_HEADING_RE = re.compile(
+    r'#+\s*\[?(?P<version>[0-9]+\.[0-9]+\.[0-9]+)(?:\]|\s|$)',
+)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReleaseNotes:
     """Generated release notes from git-cliff."""
 
@@ -25,7 +36,9 @@ class ReleaseNotes:
     markdown: str
 
 
-def _git_cliff_base_cmd() -> list[str]:
+@functools.lru_cache(maxsize=1)
+def _git_cliff_base_cmd() -> tuple[str, ...]:
+    """Locate git-cliff once per process; neither the env nor `PATH` change mid-run."""
     scripts_dir = sysconfig.get_path('scripts')
     if scripts_dir:
         scripts_path = Path(scripts_dir)
@@ -40,17 +53,42 @@ def _git_cliff_base_cmd() -> list[str]:
         for name in candidates:
             exe = scripts_path / name
             if exe.is_file():
-                return [str(exe)]
+                return (str(exe),)
 
     if shutil.which(GIT_CLIFF_BIN):
-        return [GIT_CLIFF_BIN]
+        return (GIT_CLIFF_BIN,)
     raise MissingCliError(GIT_CLIFF_BIN)
 
 
-def _bump_args(bump: GitCliffBump) -> list[str]:
-    if bump == 'auto':
-        return ['--bump']
-    return ['--bump', bump]
+@functools.lru_cache(maxsize=1)
+def git_cliff_version() -> str:
+    """Return the `--version` output of the git-cliff executable releez runs.
+
+    Raises:
+        MissingCliError: If `git-cliff` is not available.
+        ExternalCommandError: If git-cliff fails.
+    """
+    return run_checked([*_git_cliff_base_cmd(), '--version'])
+
+
+_BUMP_ARGS: dict[GitCliffBump, tuple[str, ...]] = {
+    'auto': ('--bump',),
+    'major': ('--bump', 'major'),
+    'minor': ('--bump', 'minor'),
+    'patch': ('--bump', 'patch'),
+}
+
+
+def _release_heading_version(markdown: str) -> str | None:
+    # Only the first heading is the release heading; later ones are sections or
+    # commit bodies and must not be read as the version.
+    heading = next((line for line in markdown.splitlines() if line.startswith('#')), '')
+    m = _RELEASE_HEADING_RE.match(heading)
+    return m.group('version') if m else None
+
+
+def _bump_args(bump: GitCliffBump) -> tuple[str, ...]:
+    return _BUMP_ARGS[bump]
 
 
 class GitCliff:
@@ -59,6 +97,13 @@ class GitCliff:
     def __init__(self, *, repo_root: Path) -> None:
         self._repo_root = repo_root
         self._cmd = _git_cliff_base_cmd()
+        # Shared by every invocation; built once rather than per call.
+        self._base_args = (
+            *self._cmd,
+            '--unreleased',
+            '--tag-pattern',
+            GIT_CLIFF_TAG_PATTERN,
+        )
 
     def compute_next_version(self, *, bump: GitCliffBump) -> str:
         """Compute the next version using git-cliff.
@@ -75,14 +120,7 @@ class GitCliff:
             GitCliffVersionComputeError: If git-cliff returns an empty version.
         """
         version = run_checked(
-            [
-                *self._cmd,
-                '--unreleased',
-                '--bumped-version',
-                '--tag-pattern',
-                GIT_CLIFF_TAG_PATTERN,
-                *_bump_args(bump),
-            ],
+            [*self._base_args, '--bumped-version', *_bump_args(bump)],
             cwd=self._repo_root,
         ).strip()
         if not version:
@@ -106,25 +144,39 @@ class GitCliff:
             MissingCliError: If `git-cliff` is not available.
             ExternalCommandError: If git-cliff fails.
         """
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            out_path = Path(tmp_dir) / 'RELEASE_NOTES.md'
-            run_checked(
-                [
-                    *self._cmd,
-                    '--unreleased',
-                    '--strip',
-                    'all',
-                    '--tag',
-                    version,
-                    '--tag-pattern',
-                    GIT_CLIFF_TAG_PATTERN,
-                    '--output',
-                    str(out_path),
-                ],
-                cwd=self._repo_root,
-                capture_stdout=False,
-            )
-            return out_path.read_text(encoding='utf-8')
+        return self._render_unreleased(['--tag', version])
+
+    def compute_version_and_notes(self, *, bump: GitCliffBump) -> ReleaseNotes:
+        """Compute the next version and its release notes in one git-cliff run.
+
+        The version is read from the first heading of the rendered notes. If that
+        heading is not a plain release version, it falls back to
+        `compute_next_version`.
+
+        Args:
+            bump: The bump mode for git-cliff.
+
+        Returns:
+            The computed next version and its markdown notes.
+
+        Raises:
+            MissingCliError: If `git-cliff` is not available.
+            ExternalCommandError: If git-cliff fails.
+            GitCliffVersionComputeError: If git-cliff returns an empty version.
+        """
+        markdown = self._render_unreleased(_bump_args(bump))
+        version = _release_heading_version(markdown) or self.compute_next_version(
+            bump=bump,
+        )
+        return ReleaseNotes(version=version, markdown=markdown)
+
+    def _render_unreleased(self, version_args: Sequence[str]) -> str:
+        # stdout is exactly what `--output` would write, so skip the file round-trip.
+        return run_checked(
+            [*self._base_args, '--strip', 'all', *version_args],
+            cwd=self._repo_root,
+            strip=False,
+        )
 
     def prepend_to_changelog(
         self,
@@ -144,13 +196,10 @@ class GitCliff:
         """
         run_checked(
             [
-                *self._cmd,
+                *self._base_args,
                 '-v',
-                '--unreleased',
                 '--tag',
                 version,
-                '--tag-pattern',
-                GIT_CLIFF_TAG_PATTERN,
                 '--prepend',
                 str(changelog_path),
             ],
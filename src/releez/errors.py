@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -10,6 +10,15 @@ if TYPE_CHECKING:
 class ReleezError(RuntimeError):
     """Base error for Releez."""
 
+    # Fixed message for argument-free errors, returned by `__str__` when no
+    # message was passed. Subclasses that only need this skip `__init__`.
+    _MESSAGE: ClassVar[str] = ''
+
+    def __str__(self) -> str:
+        if not self.args and self._MESSAGE:
+            return self._MESSAGE
+        return super().__str__()
+
 
 class MissingCliError(ReleezError):
     """Raised when a required CLI executable is missing."""
@@ -54,17 +63,13 @@ class ExternalCommandError(ReleezError):
 class GitRepoRootResolveError(ReleezError):
     """Raised when the git repository root cannot be determined."""
 
-    def __init__(self) -> None:
-        super().__init__('Failed to resolve git repository root.')
+    _MESSAGE = 'Failed to resolve git repository root.'
 
 
 class DirtyWorkingTreeError(ReleezError):
     """Raised when the working tree is not clean."""
 
-    def __init__(self) -> None:
-        super().__init__(
-            'Working tree is not clean. Commit or stash changes before running.',
-        )
+    _MESSAGE = 'Working tree is not clean. Commit or stash changes before running.'
 
 
 class GitRemoteNotFoundError(ReleezError):
@@ -100,8 +105,7 @@ class GitBranchExistsError(ReleezError):
 class GitCliffVersionComputeError(ReleezError):
     """Raised when git-cliff cannot compute the next version."""
 
-    def __init__(self) -> None:
-        super().__init__('Failed to compute next version via git-cliff.')
+    _MESSAGE = 'Failed to compute next version via git-cliff.'
 
 
 class ChangelogNotFoundError(ReleezError):
@@ -117,26 +121,22 @@ class ChangelogNotFoundError(ReleezError):
 class ChangelogFormatCommandRequiredError(ReleezError):
     """Raised when changelog formatting is requested but not configured."""
 
-    def __init__(self) -> None:
-        super().__init__(
-            'Changelog formatting was requested, but no format command is configured.\n'
-            'Configure it via `releez.toml`:\n'
-            '  [hooks]\n'
-            '  changelog_format = ["dprint", "fmt", "{changelog}"]\n'
-            'Or via `pyproject.toml`:\n'
-            '  [tool.releez.hooks]\n'
-            '  changelog_format = ["dprint", "fmt", "{changelog}"]\n'
-            'Or pass `--changelog-format-cmd` (repeatable) on the CLI.',
-        )
+    _MESSAGE = (
+        'Changelog formatting was requested, but no format command is configured.\n'
+        'Configure it via `releez.toml`:\n'
+        '  [hooks]\n'
+        '  changelog_format = ["dprint", "fmt", "{changelog}"]\n'
+        'Or via `pyproject.toml`:\n'
+        '  [tool.releez.hooks]\n'
+        '  changelog_format = ["dprint", "fmt", "{changelog}"]\n'
+        'Or pass `--changelog-format-cmd` (repeatable) on the CLI.'
+    )
 
 
 class GitHubTokenRequiredError(ReleezError):
     """Raised when a GitHub token is required but not provided."""
 
-    def __init__(self) -> None:
-        super().__init__(
-            'GitHub token is required to create a PR; pass --github-token or set GITHUB_TOKEN.',
-        )
+    _MESSAGE = 'GitHub token is required to create a PR; pass --github-token or set GITHUB_TOKEN.'
 
 
 class GitRemoteUrlRequiredError(ReleezError):
@@ -168,29 +168,22 @@ class InvalidGitHubRemoteError(ReleezError):
 class MissingGitHubDependencyError(ReleezError):
     """Raised when PyGithub is not available but PR creation was requested."""
 
-    def __init__(self) -> None:
-        super().__init__(
-            'PyGithub is required for PR creation but is not available.',
-        )
+    _MESSAGE = 'PyGithub is required for PR creation but is not available.'
 
 
 class BuildNumberRequiredError(ReleezError):
     """Raised when a prerelease build is missing a build number."""
 
-    def __init__(self) -> None:
-        super().__init__(
-            'Build number is required for prerelease builds; pass --build-number or set RELEEZ_BUILD_NUMBER.',
-        )
+    _MESSAGE = 'Build number is required for prerelease builds; pass --build-number or set RELEEZ_BUILD_NUMBER.'
 
 
 class PrereleaseNumberRequiredError(ReleezError):
     """Raised when a prerelease build is missing a prerelease number."""
 
-    def __init__(self) -> None:
-        super().__init__(
-            'Prerelease number is required for prerelease builds; '
-            'pass --prerelease-number or set RELEEZ_PRERELEASE_NUMBER.',
-        )
+    _MESSAGE = (
+        'Prerelease number is required for prerelease builds; '
+        'pass --prerelease-number or set RELEEZ_PRERELEASE_NUMBER.'
+    )
 
 
 class InvalidReleaseVersionError(ReleezError):
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import functools
 from contextlib import suppress
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from git import Repo
+from git import Actor, Repo
 from git.exc import GitCommandError, GitCommandNotFound
 
 from releez.errors import (
@@ -16,11 +18,13 @@ from releez.errors import (
     GitTagExistsError,
     MissingCliError,
 )
+from releez.process import GIT_BIN, run_checked, run_probe
 
-GIT_BIN = 'git'
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RepoInfo:
     """Information about a Git repository.
 
@@ -39,6 +43,9 @@ class RepoInfo:
 def open_repo(*, cwd: Path | None = None) -> tuple[Repo, RepoInfo]:
     """Open a Git repository and gather information about it.
 
+    The repository root and origin URL are memoized per resolved working
+    directory; the `Repo` and the active branch are read fresh on every call.
+
     Args:
         cwd: The working directory to start searching for the repository.
 
@@ -49,19 +56,8 @@ def open_repo(*, cwd: Path | None = None) -> tuple[Repo, RepoInfo]:
         MissingCliError: If the `git` CLI is not available.
         GitRepoRootResolveError: If the repository root cannot be determined.
     """
-    repo = Repo(cwd or Path.cwd(), search_parent_directories=True)
-    try:
-        root = Path(
-            repo.working_tree_dir or repo.git.rev_parse('--show-toplevel'),
-        )
-    except GitCommandNotFound as exc:  # pragma: no cover
-        raise MissingCliError(GIT_BIN) from exc
-    except GitCommandError as exc:  # pragma: no cover
-        raise GitRepoRootResolveError from exc
-
-    remote_url = ''
-    with suppress(AttributeError, IndexError):
-        remote_url = repo.remotes.origin.url
+    root, remote_url = _locate_repo((cwd or Path.cwd()).resolve())
+    repo = Repo(root)
 
     active_branch: str | None
     try:
@@ -76,6 +72,25 @@ def open_repo(*, cwd: Path | None = None) -> tuple[Repo, RepoInfo]:
     )
 
 
+@functools.lru_cache(maxsize=8)
+def _locate_repo(cwd: Path) -> tuple[Path, str]:
+    with Repo(cwd, search_parent_directories=True) as repo:
+        try:
+            root = Path(
+                repo.working_tree_dir or repo.git.rev_parse('--show-toplevel'),
+            )
+        except GitCommandNotFound as exc:  # pragma: no cover
+            raise MissingCliError(GIT_BIN) from exc
+        except GitCommandError as exc:  # pragma: no cover
+            raise GitRepoRootResolveError from exc
+
+        # One config lookup instead of materialising a `Remote` for every remote.
+        remote_url = str(
+            repo.config_reader().get_value('remote "origin"', 'url', default=''),
+        )
+    return root, remote_url
+
+
 def ensure_clean(repo: Repo) -> None:
     """Ensure the repository working tree is clean.
 
@@ -85,7 +100,9 @@ def ensure_clean(repo: Repo) -> None:
     Raises:
         DirtyWorkingTreeError: If the repository has uncommitted changes.
     """
-    if repo.is_dirty(untracked_files=True):
+    # A single status call; `is_dirty` runs two diffs and a status. Any output
+    # (staged, unstaged, or untracked) means the tree is dirty.
+    if repo.git.status('--porcelain=v1', '-z', '--untracked-files=normal'):
         raise DirtyWorkingTreeError
 
 
@@ -124,16 +141,19 @@ def checkout_remote_branch(
         GitRemoteBranchNotFoundError: If the remote branch does not exist.
     """
     ref = f'{remote_name}/{branch}'
+    # Check out first and only probe the ref if that fails; `--detach` keeps git
+    # from reading a missing ref as a pathspec.
     try:
-        repo.git.rev_parse('--verify', ref)
+        repo.git.checkout('--detach', ref)
     except GitCommandNotFound as exc:  # pragma: no cover
         raise MissingCliError(GIT_BIN) from exc
     except GitCommandError as exc:
+        if _ref_exists(repo, ref):
+            raise
         raise GitRemoteBranchNotFoundError(
             remote_name=remote_name,
             branch=branch,
         ) from exc
-    repo.git.checkout(ref)
 
 
 def create_and_checkout_branch(repo: Repo, *, name: str) -> None:
@@ -148,33 +168,68 @@ def create_and_checkout_branch(repo: Repo, *, name: str) -> None:
         GitBranchExistsError: If the local branch already exists.
     """
     try:
-        repo.git.rev_parse('--verify', name)
+        repo.git.checkout('-b', name)
     except GitCommandNotFound as exc:  # pragma: no cover
         raise MissingCliError(GIT_BIN) from exc
-    except GitCommandError:
-        repo.git.checkout('-b', name)
-        return
+    except GitCommandError as exc:
+        if _ref_exists(repo, f'refs/heads/{name}'):
+            raise GitBranchExistsError(name) from exc
+        raise
+
+
+def _ref_exists(repo: Repo, ref: str) -> bool:
+    probe = run_probe(
+        [GIT_BIN, 'rev-parse', '--verify', '--quiet', f'{ref}^{{commit}}'],
+        cwd=_repo_cwd(repo),
+    )
+    return probe.ok
 
-    raise GitBranchExistsError(name)
 
+def _repo_cwd(repo: Repo) -> Path:
+    return Path(repo.working_tree_dir or repo.git_dir)
 
-def commit_file(repo: Repo, *, path: Path, message: str) -> None:
+
+def commit_file(
+    repo: Repo,
+    *,
+    repo_root: Path,
+    path: Path,
+    message: str,
+) -> None:
     """Stage and commit a file with the given message.
 
     Args:
         repo: The Git repository.
-        path: The path to the file to stage and commit.
+        repo_root: The repository root, as resolved by `open_repo`.
+        path: The path to the file to stage and commit; relative paths are taken
+            relative to `repo_root`.
         message: The commit message.
     """
-    root = Path(repo.working_tree_dir or '.').resolve()
-    abs_path = path.resolve()
-    try:
-        rel_path = abs_path.relative_to(root)
-        pathspec = str(rel_path)
-    except ValueError:
-        pathspec = str(abs_path)
-    repo.index.add([pathspec])
-    repo.index.commit(message)
+    pathspec = str(path)
+    if path.is_absolute():
+        with suppress(ValueError):
+            pathspec = str(path.relative_to(repo_root))
+    # Plain git rather than GitPython's index API, which rewrites the whole index in
+    # Python. `--only` commits just this path. Hooks run, as they did with the index
+    # API, and the identity is GitPython's, which falls back to `user@host` where git
+    # would refuse to commit without a configured user.
+    config = repo.config_reader()
+    author = Actor.author(config)
+    committer = Actor.committer(config)
+    repo.git.add('--', pathspec)
+    repo.git.commit(
+        '--only',
+        '-m',
+        message,
+        '--',
+        pathspec,
+        env={
+            'GIT_AUTHOR_NAME': author.name or '',
+            'GIT_AUTHOR_EMAIL': author.email or '',
+            'GIT_COMMITTER_NAME': committer.name or '',
+            'GIT_COMMITTER_EMAIL': committer.email or '',
+        },
+    )
 
 
 def push_set_upstream(repo: Repo, *, remote_name: str, branch: str) -> None:
@@ -188,7 +243,7 @@ def push_set_upstream(repo: Repo, *, remote_name: str, branch: str) -> None:
     repo.git.push('-u', remote_name, branch)
 
 
-def create_tags(repo: Repo, *, tags: list[str], force: bool) -> None:
+def create_tags(repo: Repo, *, tags: Sequence[str], force: bool) -> None:
     """Create git tags pointing at HEAD.
 
     Args:
@@ -198,35 +253,56 @@ def create_tags(repo: Repo, *, tags: list[str], force: bool) -> None:
 
     Raises:
         GitTagExistsError: If a tag exists and force is false.
+        ExternalCommandError: If git fails to update the tag refs.
     """
-    existing = {t.name for t in repo.tags}
-    for tag in tags:
-        if tag in existing and not force:
-            raise GitTagExistsError(tag)
-        if force:
-            repo.git.tag('-f', tag)
-        else:
-            repo.create_tag(tag)
+    if not tags:
+        return
+    if not force:
+        existing = _existing_tags(repo, tags=tags)
+        for tag in tags:
+            if tag in existing:
+                raise GitTagExistsError(tag)
+
+    # One update-ref transaction applies every tag, or none of them, in a single
+    # process. `create` refuses to clobber a tag that appeared since the check.
+    verb = 'update' if force else 'create'
+    run_checked(
+        [GIT_BIN, 'update-ref', '--stdin'],
+        cwd=_repo_cwd(repo),
+        stdin=''.join(f'{verb} refs/tags/{tag} HEAD\n' for tag in tags),
+    )
+
+
+def _existing_tags(repo: Repo, *, tags: Sequence[str]) -> set[str]:
+    # Ask git for just the requested refs rather than walking every tag object.
+    raw = repo.git.for_each_ref(
+        '--format=%(refname:strip=2)',
+        *(f'refs/tags/{tag}' for tag in tags),
+    )
+    return set(raw.splitlines())
 
 
-def push_tags(
+def push_refs(
     repo: Repo,
     *,
     remote_name: str,
-    tags: list[str],
-    force: bool,
+    tags: Sequence[str] = (),
+    force_tags: Sequence[str] = (),
 ) -> None:
-    """Push git tags to a remote.
+    """Push tags to a remote in a single atomic `git push`.
+
+    One push means one connection to the remote, and `--atomic` makes the remote
+    accept every ref or none of them. Force tags are pushed straight from HEAD,
+    so callers can move the matching local tags only once the push succeeded.
 
     Args:
         repo: The Git repository.
         remote_name: The remote to push to.
-        tags: The tag names to push.
-        force: If true, force-update tags on the remote.
+        tags: Local tag names to push; rejected if they already differ on the remote.
+        force_tags: Tag names to force-update on the remote to point at HEAD.
     """
-    if not tags:
-        return
-    if force:
-        repo.git.push('--force', remote_name, *tags)
+    refspecs = [f'refs/tags/{tag}:refs/tags/{tag}' for tag in tags]
+    refspecs += [f'+HEAD:refs/tags/{tag}' for tag in force_tags]
+    if not refspecs:
         return
-    repo.git.push(remote_name, *tags)
+    repo.git.push('--atomic', remote_name, *refspecs)
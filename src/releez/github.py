@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import os
 import re
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
 from releez.errors import InvalidGitHubRemoteError, MissingGitHubDependencyError
 
+if TYPE_CHECKING:
+    from github import Github
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class PullRequest:
     """A minimal representation of a created GitHub pull request.
 
@@ -21,7 +27,7 @@ class PullRequest:
     number: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PullRequestCreateRequest:
     """Parameters for creating a GitHub pull request.
 
@@ -44,40 +50,54 @@ class PullRequestCreateRequest:
     labels: list[str]
 
 
-_SCP_SSH_RE = re.compile(
-    r'^git@(?P<host>[^:]+):(?P<full>[^/]+/[^/]+?)(?:\\.git)?$',
-)
-_SSH_URL_RE = re.compile(
-    r'^ssh://git@(?P<host>[^/]+)/(?P<full>[^/]+/[^/]+?)(?:\\.git)?$',
+# SCP-style SSH (`git@host:org/repo`), SSH URLs, and HTTP(S) URLs in one pass.
+_REMOTE_RE = re.compile(
+    r'^(?:git@(?P<scp_host>[^:]+):'
+    r'|ssh://git@(?P<ssh_host>[^/]+)/'
+    r'|https?://(?P<https_host>[^/]+)/)'
+    r'(?P<full>[^/]+/[^/]+?)(?:\.git)?$',
 )
-_HTTPS_RE = re.compile(
-    r'^https?://(?P<host>[^/]+)/(?P<full>[^/]+/[^/]+?)(?:\\.git)?$',
+
+
+_GITHUB_URL_ENV_VARS = (
+    'RELEEZ_GITHUB_SERVER_URL',
+    'GITHUB_SERVER_URL',
+    'RELEEZ_GITHUB_API_URL',
+    'GITHUB_API_URL',
 )
 
+# Values of `_GITHUB_URL_ENV_VARS`, in order. Used as the cache key so a changed
+# env is picked up without re-parsing the URLs on every lookup.
+_GitHubUrlEnv = tuple[str | None, str | None, str | None, str | None]
 
-def _github_api_base_url_from_env() -> str | None:
-    api_url = os.getenv('RELEEZ_GITHUB_API_URL') or os.getenv('GITHUB_API_URL')
+
+def _github_url_env() -> _GitHubUrlEnv:
+    server, gh_server, api, gh_api = (os.getenv(var) for var in _GITHUB_URL_ENV_VARS)
+    return server, gh_server, api, gh_api
+
+
+@functools.lru_cache(maxsize=1)
+def _github_api_base_url(env: _GitHubUrlEnv) -> str | None:
+    server_url, gh_server_url, api_url, gh_api_url = env
+    api_url = api_url or gh_api_url
     if api_url:
         return api_url.rstrip('/')
 
-    server_url = os.getenv('RELEEZ_GITHUB_SERVER_URL') or os.getenv(
-        'GITHUB_SERVER_URL',
-    )
+    server_url = server_url or gh_server_url
     if not server_url:
         return None
     return f'{server_url.rstrip("/")}/api/v3'
 
 
-def _allowed_github_hosts_from_env() -> set[str]:
+def _github_api_base_url_from_env() -> str | None:
+    return _github_api_base_url(_github_url_env())
+
+
+@functools.lru_cache(maxsize=1)
+def _allowed_github_hosts(env: _GitHubUrlEnv) -> frozenset[str]:
     hosts = {'github.com'}
 
-    for var in (
-        'RELEEZ_GITHUB_SERVER_URL',
-        'GITHUB_SERVER_URL',
-        'RELEEZ_GITHUB_API_URL',
-        'GITHUB_API_URL',
-    ):
-        raw = os.getenv(var)
+    for raw in env:
         if not raw:
             continue
         parsed = urlparse(raw)
@@ -87,22 +107,52 @@ def _allowed_github_hosts_from_env() -> set[str]:
         # allow plain host values (not URLs)
         hosts.add(raw.strip().rstrip('/'))
 
-    return hosts
+    return frozenset(hosts)
+
+
+def _allowed_github_hosts_from_env() -> frozenset[str]:
+    return _allowed_github_hosts(_github_url_env())
 
 
 def _parse_github_full_name(remote_url: str) -> str:
     remote_url = remote_url.strip()
-    for regex in (_SCP_SSH_RE, _SSH_URL_RE, _HTTPS_RE):
-        m = regex.match(remote_url)
-        if m:
-            host = m.group('host')
-            if host not in _allowed_github_hosts_from_env():
-                raise InvalidGitHubRemoteError(remote_url)
-            full_name = m.group('full')
-            if full_name.endswith('.git'):
-                full_name = full_name.removesuffix('.git')
-            return full_name
-    raise InvalidGitHubRemoteError(remote_url)
+    m = _REMOTE_RE.match(remote_url)
+    if m is None:
+        raise InvalidGitHubRemoteError(remote_url)
+    host = m.group('scp_host') or m.group('ssh_host') or m.group('https_host')
+    if host not in _allowed_github_hosts_from_env():
+        raise InvalidGitHubRemoteError(remote_url)
+    return m.group('full')
+
+
+# The client last built, keyed by a digest of its token and its API base URL. The
+# key never holds the raw token; only the live client keeps it, as it must to
+# authenticate. One slot is enough: a run uses a single token.
+_GITHUB_CLIENTS: dict[tuple[str, str | None], Github] = {}
+
+
+def _github_client(token: str, base_url: str | None) -> Github:
+    # Reusing the client keeps its HTTP session, so later calls skip the TLS setup.
+    key = (hashlib.sha256(token.encode()).hexdigest(), base_url)
+    client = _GITHUB_CLIENTS.get(key)
+    if client is None:
+        client = _new_github_client(token, base_url)
+        _GITHUB_CLIENTS.clear()
+        _GITHUB_CLIENTS[key] = client
+    return client
+
+
+def _new_github_client(token: str, base_url: str | None) -> Github:
+    # `lazy` skips the `GET /repos/{full_name}` that `get_repo` would otherwise make;
+    # creating the PR only needs the repo URL.
+    try:
+        from github import Github  # noqa: PLC0415
+    except ImportError as exc:
+        raise MissingGitHubDependencyError from exc
+
+    if base_url:
+        return Github(login_or_token=token, base_url=base_url, lazy=True)
+    return Github(token, lazy=True)
 
 
 def create_pull_request(request: PullRequestCreateRequest) -> PullRequest:
@@ -118,21 +168,8 @@ def create_pull_request(request: PullRequestCreateRequest) -> PullRequest:
         MissingGitHubDependencyError: If PyGithub is not installed.
         InvalidGitHubRemoteError: If the remote URL cannot be mapped to a GitHub repo.
     """
-    try:
-        from github import Github  # noqa: PLC0415
-    except ImportError as exc:
-        raise MissingGitHubDependencyError from exc
-
     full_name = _parse_github_full_name(request.remote_url)
-    base_url = _github_api_base_url_from_env()
-    gh = (
-        Github(
-            login_or_token=request.token,
-            base_url=base_url,
-        )
-        if base_url
-        else Github(request.token)
-    )
+    gh = _github_client(request.token, _github_api_base_url_from_env())
     repo = gh.get_repo(full_name)
     pr = repo.create_pull(
         title=request.title,
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from releez.cliff import GIT_CLIFF_TAG_PATTERN, git_cliff_version
+from releez.errors import ReleezError
+from releez.process import GIT_BIN, run_checked
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from releez.cliff import GitCliffBump
+
+CACHE_DIR_NAME = 'releez'
+CACHE_FILE_NAME = 'next_version.json'
+
+# Every place git-cliff discovers its config in the project, in its lookup order:
+# standalone files first, then the embedded `[tool.git-cliff]` /
+# `[package.metadata.git-cliff]` tables.
+_PROJECT_CONFIG_FILES = (
+    'cliff.toml',
+    '.cliff.toml',
+    '.config/cliff.toml',
+    'pyproject.toml',
+    'Cargo.toml',
+)
+
+
+def _user_config_files() -> list[Path]:
+    """The user-level `git-cliff/cliff.toml` candidates for this platform."""
+    dirs = [os.environ.get('XDG_CONFIG_HOME'), os.environ.get('APPDATA')]
+    home = Path.home()
+    dirs += [str(home / '.config'), str(home / 'Library' / 'Application Support')]
+    return [Path(d) / 'git-cliff' / 'cliff.toml' for d in dirs if d]
+
+
+def _fingerprint(repo_root: Path) -> str | None:
+    """Fingerprint the inputs git-cliff uses to compute the next version.
+
+    Covers HEAD, every tag ref, the git-cliff version, every config file git-cliff
+    could discover, and `GIT_CLIFF*` env vars.
+
+    Returns:
+        A hex digest, or None if the repository state cannot be read.
+    """
+    try:
+        refs = run_checked([GIT_BIN, 'show-ref', '--head', '--tags'], cwd=repo_root)
+        version = git_cliff_version()
+    except ReleezError:
+        return None
+
+    digest = hashlib.sha256(refs.encode('utf-8'))
+    digest.update(GIT_CLIFF_TAG_PATTERN.encode('utf-8'))
+    digest.update(version.encode('utf-8'))
+    config_files = [repo_root / name for name in _PROJECT_CONFIG_FILES]
+    for path in [*config_files, *_user_config_files()]:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        digest.update(f'{path}:{stat.st_mtime_ns}:{stat.st_size}'.encode())
+    for key, value in sorted(os.environ.items()):
+        if key.startswith('GIT_CLIFF'):
+            digest.update(f'{key}={value}'.encode())
+    return digest.hexdigest()
+
+
+def _read_entry(cache_path: Path) -> dict[str, object]:
+    with suppress(OSError, ValueError):
+        entry = json.loads(cache_path.read_text(encoding='utf-8'))
+        if isinstance(entry, dict):
+            return entry
+    return {}
+
+
+def _write_entry(cache_path: Path, entry: dict[str, object]) -> None:
+    with suppress(OSError):
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            'w',
+            encoding='utf-8',
+            dir=cache_path.parent,
+            prefix=f'{cache_path.name}.',
+            delete=False,
+        ) as tmp:
+            json.dump(entry, tmp)
+        Path(tmp.name).replace(cache_path)
+
+
+def get_or_compute(
+    *,
+    repo_root: Path,
+    bump: GitCliffBump,
+    compute: Callable[[], str],
+) -> str:
+    """Return the next version for the current repo state, computing it on a miss.
+
+    The result is stored in `.git/releez/next_version.json` and reused until HEAD,
+    the tag set, the git-cliff version, or any config file git-cliff could discover
+    changes. Repositories without a `.git` directory (e.g. worktrees) always compute.
+
+    Args:
+        repo_root: The repository root.
+        bump: The bump mode the version is computed with.
+        compute: Computes the next version via git-cliff on a cache miss.
+
+    Returns:
+        The next version.
+    """
+    git_dir = repo_root / '.git'
+    if not git_dir.is_dir():
+        return compute()
+    fingerprint = _fingerprint(repo_root)
+    if fingerprint is None:
+        return compute()
+
+    cache_path = git_dir / CACHE_DIR_NAME / CACHE_FILE_NAME
+    entry = _read_entry(cache_path)
+    version = entry.get('version')
+    if entry.get('fingerprint') == fingerprint and entry.get('bump') == bump and isinstance(version, str):
+        return version
+
+    version = compute()
+    _write_entry(
+        cache_path,
+        {'fingerprint': fingerprint, 'bump': bump, 'version': version},
+    )
+    return version
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import subprocess
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from releez.errors import ExternalCommandError, MissingCliError
@@ -9,12 +10,72 @@ if TYPE_CHECKING:
     from collections.abc import Sequence
     from pathlib import Path
 
+GIT_BIN = 'git'
+
+
+@dataclass(frozen=True, slots=True)
+class ProbeResult:
+    """Outcome of a command whose non-zero exit is an expected answer.
+
+    Attributes:
+        returncode: The exit status of the command.
+        stdout: The stripped stdout of the command.
+    """
+
+    returncode: int
+    stdout: str
+
+    @property
+    def ok(self) -> bool:
+        """Whether the command exited successfully."""
+        return self.returncode == 0
+
+
+def _argv(args: Sequence[str]) -> list[str]:
+    return args if isinstance(args, list) else list(args)
+
+
+def run_probe(
+    args: Sequence[str],
+    *,
+    cwd: Path | None = None,
+) -> ProbeResult:
+    """Run a command whose exit status is the answer, e.g. `git rev-parse --verify`.
+
+    Unlike `run_checked`, a non-zero exit is returned rather than raised, and
+    stderr is discarded.
+
+    Args:
+        args: The command and arguments to execute.
+        cwd: Optional working directory for the command.
+
+    Returns:
+        The exit status and stripped stdout of the command.
+
+    Raises:
+        MissingCliError: If the executable is not found.
+    """
+    try:
+        res = subprocess.run(  # noqa: S603
+            _argv(args),
+            cwd=cwd,
+            check=False,
+            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+    except FileNotFoundError as exc:
+        raise MissingCliError(args[0]) from exc
+    return ProbeResult(returncode=res.returncode, stdout=(res.stdout or '').strip())
+
 
 def run_checked(
     args: Sequence[str],
     *,
     cwd: Path | None = None,
     capture_stdout: bool = True,
+    strip: bool = True,
+    stdin: str | None = None,
 ) -> str:
     """Run a command and raise a ReleezError on failure.
 
@@ -22,9 +83,11 @@ def run_checked(
         args: The command and arguments to execute.
         cwd: Optional working directory for the command.
         capture_stdout: If false, stdout is not captured.
+        strip: If false, stdout is returned verbatim instead of stripped.
+        stdin: Optional text to feed to the command's stdin.
 
     Returns:
-        The stripped stdout of the command.
+        The stdout of the command, stripped unless `strip` is false.
 
     Raises:
         MissingCliError: If the executable is not found.
@@ -32,10 +95,11 @@ def run_checked(
     """
     try:
         res = subprocess.run(  # noqa: S603
-            list(args),
+            _argv(args),
             cwd=cwd,
             check=True,
             text=True,
+            input=stdin,
             stdout=subprocess.PIPE if capture_stdout else None,
             stderr=subprocess.PIPE,
         )
@@ -49,4 +113,5 @@ def run_checked(
             stderr=stderr,
         ) from exc
 
-    return (res.stdout or '').strip()
+    stdout = res.stdout or ''
+    return stdout.strip() if strip else stdout
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from git import Repo
 
-from releez.cliff import GitCliff, GitCliffBump
+from releez.cliff import GitCliff, GitCliffBump, ReleaseNotes
 from releez.errors import (
     ChangelogFormatCommandRequiredError,
     ChangelogNotFoundError,
@@ -27,7 +27,7 @@ from releez.github import PullRequestCreateRequest, create_pull_request
 from releez.process import run_checked
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StartReleaseResult:
     """Result of starting a release.
 
@@ -44,7 +44,7 @@ class StartReleaseResult:
     pr_url: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StartReleaseInput:
     """Inputs for starting a release.
 
@@ -77,7 +77,7 @@ class StartReleaseInput:
     dry_run: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _MaybeCreatePullRequestInput:
     """Inputs for optionally creating a pull request.
 
@@ -129,14 +129,18 @@ def _maybe_create_pull_request(
     return pr.url
 
 
-def _resolve_release_version(
+def _resolve_release_notes(
     *,
     cliff: GitCliff,
     release_input: StartReleaseInput,
-) -> str:
+) -> ReleaseNotes:
     if release_input.version_override is not None:
-        return release_input.version_override
-    return cliff.compute_next_version(bump=release_input.bump)
+        version = release_input.version_override
+        return ReleaseNotes(
+            version=version,
+            markdown=cliff.generate_unreleased_notes(version=version),
+        )
+    return cliff.compute_version_and_notes(bump=release_input.bump)
 
 
 def _resolve_changelog_path(
@@ -192,8 +196,9 @@ def start_release(
             branch=release_input.base_branch,
         )
 
-    version = _resolve_release_version(cliff=cliff, release_input=release_input)
-    notes = cliff.generate_unreleased_notes(version=version)
+    release_notes = _resolve_release_notes(cliff=cliff, release_input=release_input)
+    version = release_notes.version
+    notes = release_notes.markdown
 
     if release_input.dry_run:
         return StartReleaseResult(
@@ -219,6 +224,7 @@ def start_release(
 
     commit_file(
         repo,
+        repo_root=info.root,
         path=changelog,
         message=f'{release_input.title_prefix}{version}',
     )
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import functools
+import os
+from pathlib import Path
+
 from pydantic import AliasChoices, AliasGenerator, BaseModel, ConfigDict, Field
 from pydantic_settings import (
     BaseSettings,
@@ -99,3 +103,49 @@ class ReleezSettings(BaseSettings):
             releez_toml,
             pyproject_toml,
         )
+
+
+_CONFIG_FILES = ('releez.toml', 'pyproject.toml')
+
+# `(mtime_ns, size)` of a config file, or None if it does not exist.
+_FileKey = tuple[int, int] | None
+
+# Snapshot of every input a settings load depends on: the resolved working
+# directory, the `_FileKey` of each `_CONFIG_FILES` entry, and the sorted
+# `RELEEZ_*` env vars. It is only a cache key; the settings sources still read
+# the cwd, files, and env themselves.
+_SettingsKey = tuple[Path, tuple[_FileKey, ...], tuple[tuple[str, str], ...]]
+
+
+def _file_key(path: Path) -> _FileKey:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _settings_key() -> _SettingsKey:
+    cwd = Path.cwd().resolve()
+    files = tuple(_file_key(cwd / name) for name in _CONFIG_FILES)
+    env = tuple(sorted((k, v) for k, v in os.environ.items() if k.upper().startswith('RELEEZ_')))
+    return cwd, files, env
+
+
+def load_settings() -> ReleezSettings:
+    """Load settings for the current working directory, reusing unchanged loads.
+
+    A load is reused while the working directory, the config files' mtime and size,
+    and the `RELEEZ_*` env vars stay the same, so repeated loads in one process
+    skip re-reading and re-parsing the TOML files.
+
+    Returns:
+        The loaded settings. The instance may be shared; do not mutate it.
+    """
+    return _load_settings(_settings_key())
+
+
+@functools.lru_cache(maxsize=4)
+def _load_settings(key: _SettingsKey) -> ReleezSettings:  # noqa: ARG001
+    # `key` only selects the cache entry; see `_SettingsKey`.
+    return ReleezSettings()
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
+import functools
+import re
 from dataclasses import dataclass
 from enum import StrEnum
 
-from semver import VersionInfo
-
 from releez.errors import InvalidReleaseVersionError
 
 
@@ -16,7 +16,12 @@ class AliasVersions(StrEnum):
     minor = 'minor'
 
 
-@dataclass(frozen=True)
+# A full `x.y.z` release with semver's no-leading-zeros rule; anything else goes
+# through `VersionInfo.parse` so invalid input is rejected the same way.
+_RELEASE_VERSION_RE = re.compile(r'(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)\.(0|[1-9][0-9]*)')
+
+
+@dataclass(frozen=True, slots=True)
 class VersionTags:
     """Computed tags for a release version.
 
@@ -31,9 +36,12 @@ class VersionTags:
     minor: str
 
 
+@functools.lru_cache(maxsize=32)
 def compute_version_tags(*, version: str) -> VersionTags:
     """Compute exact/major/minor tags for a full release version.
 
+    Results are memoized per version; `VersionTags` is immutable so sharing is safe.
+
     Args:
         version: The full release version (`x.y.z`).
 
@@ -45,6 +53,14 @@ def compute_version_tags(*, version: str) -> VersionTags:
     """
     normalized = version.strip().removeprefix('v')
 
+    m = _RELEASE_VERSION_RE.fullmatch(normalized)
+    if m is not None:
+        major, minor, _patch = m.groups()
+        return VersionTags(exact=normalized, major=f'v{major}', minor=f'v{major}.{minor}')
+
+    # Only reached for input the fast path rejects, so valid versions never import semver.
+    from semver import VersionInfo  # noqa: PLC0415
+
     try:
         parsed = VersionInfo.parse(normalized)
     except ValueError as exc:
@@ -60,10 +76,11 @@ def compute_version_tags(*, version: str) -> VersionTags:
     )
 
 
-def select_tags(*, tags: VersionTags, aliases: AliasVersions) -> list[str]:
+@functools.lru_cache(maxsize=32)
+def select_tags(*, tags: VersionTags, aliases: AliasVersions) -> tuple[str, ...]:
     """Select which version aliases to output/publish given an alias level."""
     if aliases == AliasVersions.none:
-        return [tags.exact]
+        return (tags.exact,)
     if aliases == AliasVersions.major:
-        return [tags.exact, tags.major]
-    return [tags.exact, tags.major, tags.minor]
+        return (tags.exact, tags.major)
+    return (tags.exact, tags.major, tags.minor)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+import releez.cli
+import releez.cliff
+import releez.git_repo
+import releez.github
+import releez.settings
+import releez.version_tags
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Every process-wide memoized function; results must not leak between tests.
+_MEMOIZED = (
+    releez.cli._get_cliff,
+    releez.cli._resolve_release_version,
+    releez.cliff._git_cliff_base_cmd,
+    releez.cliff.git_cliff_version,
+    releez.git_repo._locate_repo,
+    releez.github._github_api_base_url,
+    releez.github._allowed_github_hosts,
+    releez.settings._load_settings,
+    releez.version_tags.compute_version_tags,
+    releez.version_tags.select_tags,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_memoized_caches() -> Iterator[None]:
+    _clear_caches()
+    yield
+    _clear_caches()
+
+
+def _clear_caches() -> None:
+    for func in _MEMOIZED:
+        func.cache_clear()
+    releez.github._GITHUB_CLIENTS.clear()
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import click
+import typer.main
+
+from releez import cli
+
+
+def test_cli_builds_only_the_resolved_command_group() -> None:
+    group = typer.main.get_command(cli.app)
+    assert isinstance(group, click.Group)
+    ctx = click.Context(group)
+
+    assert group.list_commands(ctx) == ['release', 'version']
+    assert group.commands == {}
+
+    version_group = group.get_command(ctx, 'version')
+
+    assert version_group is not None
+    assert version_group.name == 'version'
+    assert list(group.commands) == ['version']
+
+
+def test_cli_import_defers_git_and_semver() -> None:
+    code = 'import sys, releez.cli; print(sorted({"git", "semver"} & set(sys.modules)))'
+    out = subprocess.run(  # noqa: S603
+        [sys.executable, '-c', code],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    assert out.strip() == '[]'
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 from typer.testing import CliRunner
 
 from releez import cli
+from releez.cliff import ReleaseNotes
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -21,19 +22,23 @@ def test_cli_release_notes_stdout(
     repo_root.mkdir()
 
     mocker.patch(
-        'releez.cli.open_repo',
+        'releez.git_repo.open_repo',
         return_value=(object(), mocker.Mock(root=repo_root)),
     )
-    mocker.patch('releez.cli._resolve_release_version', return_value='2.3.4')
 
     cliff = mocker.Mock()
-    cliff.generate_unreleased_notes.return_value = '## 2.3.4\n\n- Change\n'
+    cliff.compute_version_and_notes.return_value = ReleaseNotes(
+        version='2.3.4',
+        markdown='## 2.3.4\n\n- Change\n',
+    )
     mocker.patch('releez.cli.GitCliff', return_value=cliff)
 
     result = runner.invoke(cli.app, ['release', 'notes'])
 
     assert result.exit_code == 0
     assert result.stdout == '## 2.3.4\n\n- Change\n\n'
+    cliff.compute_version_and_notes.assert_called_once_with(bump='auto')
+    cliff.compute_next_version.assert_not_called()
 
 
 def test_cli_release_notes_writes_file(
@@ -45,10 +50,9 @@ def test_cli_release_notes_writes_file(
     repo_root.mkdir()
 
     mocker.patch(
-        'releez.cli.open_repo',
+        'releez.git_repo.open_repo',
         return_value=(object(), mocker.Mock(root=repo_root)),
     )
-    mocker.patch('releez.cli._resolve_release_version', return_value='2.3.4')
 
     cliff = mocker.Mock()
     cliff.generate_unreleased_notes.return_value = '## 2.3.4\n'
@@ -57,8 +61,9 @@ def test_cli_release_notes_writes_file(
     output = tmp_path / 'notes.md'
     result = runner.invoke(
         cli.app,
-        ['release', 'notes', '--output', str(output)],
+        ['release', 'notes', '--version-override', '2.3.4', '--output', str(output)],
     )
 
     assert result.exit_code == 0
     assert output.read_text(encoding='utf-8') == '## 2.3.4\n'
+    cliff.generate_unreleased_notes.assert_called_once_with(version='2.3.4')
@@ -22,7 +22,7 @@ def test_cli_release_preview_writes_markdown(
     repo_root.mkdir()
 
     mocker.patch(
-        'releez.cli.open_repo',
+        'releez.git_repo.open_repo',
         return_value=(object(), mocker.Mock(root=repo_root)),
     )
 
@@ -59,7 +59,7 @@ def test_cli_release_preview_stdout(
     repo_root.mkdir()
 
     mocker.patch(
-        'releez.cli.open_repo',
+        'releez.git_repo.open_repo',
         return_value=(object(), mocker.Mock(root=repo_root)),
     )
 
@@ -80,3 +80,29 @@ def test_cli_release_preview_stdout(
     assert result.exit_code == 0
     assert '## `releez` release preview' in result.stdout
     assert '`1.2.3`' in result.stdout
+
+
+def test_cli_release_preview_reuses_computed_version(
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    runner = CliRunner()
+
+    repo_root = tmp_path / 'repo'
+    repo_root.mkdir()
+
+    mocker.patch(
+        'releez.git_repo.open_repo',
+        return_value=(object(), mocker.Mock(root=repo_root)),
+    )
+
+    cliff = mocker.Mock()
+    cliff.compute_next_version.return_value = '1.2.3'
+    mocker.patch('releez.cli.GitCliff', return_value=cliff)
+
+    first = runner.invoke(cli.app, ['release', 'preview'])
+    second = runner.invoke(cli.app, ['release', 'preview'])
+
+    assert first.exit_code == 0
+    assert second.exit_code == 0
+    cliff.compute_next_version.assert_called_once_with(bump='auto')
@@ -19,7 +19,7 @@ def test_cli_release_start_passes_version_override(
     runner = CliRunner()
 
     start_release = mocker.patch(
-        'releez.cli.start_release',
+        'releez.release.start_release',
         return_value=mocker.Mock(
             version='1.2.3',
             release_notes_markdown='notes',
@@ -50,7 +50,7 @@ def test_cli_release_start_defaults_version_override_to_none(
     runner = CliRunner()
 
     start_release = mocker.patch(
-        'releez.cli.start_release',
+        'releez.release.start_release',
         return_value=mocker.Mock(
             version='1.2.3',
             release_notes_markdown='notes',
@@ -66,6 +66,31 @@ def test_cli_release_start_defaults_version_override_to_none(
     assert release_input.version_override is None
 
 
+def test_cli_release_start_strips_labels(
+    mocker: MockerFixture,
+) -> None:
+    runner = CliRunner()
+
+    start_release = mocker.patch(
+        'releez.release.start_release',
+        return_value=mocker.Mock(
+            version='1.2.3',
+            release_notes_markdown='notes',
+            release_branch=None,
+            pr_url=None,
+        ),
+    )
+
+    result = runner.invoke(
+        cli.app,
+        ['release', 'start', '--dry-run', '--labels', 'release, hotfix,,'],
+    )
+
+    assert result.exit_code == 0
+    release_input = start_release.call_args.args[0]
+    assert release_input.labels == ['release', 'hotfix']
+
+
 def test_cli_release_start_run_changelog_format_uses_configured_command(
     mocker: MockerFixture,
     tmp_path: Path,
@@ -80,7 +105,7 @@ def test_cli_release_start_run_changelog_format_uses_configured_command(
     )
 
     start_release = mocker.patch(
-        'releez.cli.start_release',
+        'releez.release.start_release',
         return_value=mocker.Mock(
             version='1.2.3',
             release_notes_markdown='notes',
@@ -113,7 +138,7 @@ def test_cli_release_start_run_changelog_format_requires_command(
     monkeypatch.chdir(tmp_path)
 
     mocker.patch(
-        'releez.cli.start_release',
+        'releez.release.start_release',
         return_value=mocker.Mock(
             version='1.2.3',
             release_notes_markdown='notes',
@@ -17,17 +17,18 @@ def test_cli_release_tag_calls_git_helpers(mocker: MockerFixture) -> None:
 
     repo = object()
     mocker.patch(
-        'releez.cli.open_repo',
+        'releez.git_repo.open_repo',
         return_value=(repo, mocker.Mock(root=Path.cwd())),
     )
-    mocker.patch('releez.cli.fetch')
+    mocker.patch('releez.git_repo.fetch')
     mocker.patch(
         'releez.cli.compute_version_tags',
         return_value=VersionTags(exact='2.3.4', major='v2', minor='v2.3'),
     )
     mocker.patch('releez.cli.select_tags', return_value=['2.3.4', 'v2', 'v2.3'])
-    create_tags = mocker.patch('releez.cli.create_tags')
-    push_tags = mocker.patch('releez.cli.push_tags')
+    git_calls = mocker.Mock()
+    git_calls.attach_mock(mocker.patch('releez.git_repo.create_tags'), 'create_tags')
+    git_calls.attach_mock(mocker.patch('releez.git_repo.push_refs'), 'push_refs')
 
     result = runner.invoke(
         cli.app,
@@ -42,18 +43,16 @@ def test_cli_release_tag_calls_git_helpers(mocker: MockerFixture) -> None:
     )
 
     assert result.exit_code == 0
-    assert create_tags.call_args_list == [
-        mocker.call(repo, tags=['2.3.4'], force=False),
-        mocker.call(repo, tags=['v2', 'v2.3'], force=True),
-    ]
-    assert push_tags.call_args_list == [
-        mocker.call(repo, remote_name='origin', tags=['2.3.4'], force=False),
-        mocker.call(
+    # Local aliases only move after the remote accepted the push.
+    assert git_calls.mock_calls == [
+        mocker.call.create_tags(repo, tags=['2.3.4'], force=False),
+        mocker.call.push_refs(
             repo,
             remote_name='origin',
-            tags=['v2', 'v2.3'],
-            force=True,
+            tags=['2.3.4'],
+            force_tags=['v2', 'v2.3'],
         ),
+        mocker.call.create_tags(repo, tags=['v2', 'v2.3'], force=True),
     ]
     assert result.stdout == '2.3.4\nv2\nv2.3\n'
 
@@ -66,10 +65,10 @@ def test_cli_release_tag_defaults_to_git_cliff(
 
     repo = object()
     mocker.patch(
-        'releez.cli.open_repo',
+        'releez.git_repo.open_repo',
         return_value=(repo, mocker.Mock(root=tmp_path)),
     )
-    mocker.patch('releez.cli.fetch')
+    mocker.patch('releez.git_repo.fetch')
 
     cliff = mocker.Mock()
     cliff.compute_next_version.return_value = '2.3.4'
@@ -80,18 +79,18 @@ def test_cli_release_tag_defaults_to_git_cliff(
         return_value=VersionTags(exact='2.3.4', major='v2', minor='v2.3'),
     )
     mocker.patch('releez.cli.select_tags', return_value=['2.3.4'])
-    create_tags = mocker.patch('releez.cli.create_tags')
-    push_tags = mocker.patch('releez.cli.push_tags')
+    create_tags = mocker.patch('releez.git_repo.create_tags')
+    push_refs = mocker.patch('releez.git_repo.push_refs')
 
     result = runner.invoke(cli.app, ['release', 'tag'])
 
     assert result.exit_code == 0
     cliff.compute_next_version.assert_called_once_with(bump='auto')
     create_tags.assert_called_once_with(repo, tags=['2.3.4'], force=False)
-    push_tags.assert_called_once_with(
+    push_refs.assert_called_once_with(
         repo,
         remote_name='origin',
         tags=['2.3.4'],
-        force=False,
+        force_tags=[],
     )
     assert result.stdout == '2.3.4\n'
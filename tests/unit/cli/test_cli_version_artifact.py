@@ -21,7 +21,12 @@ def test_cli_version_artifact_builds_input_and_prints_result(
 ) -> None:
     runner = CliRunner()
 
-    def _fake_compute(artifact_input: ArtifactVersionInput) -> str:
+    def _fake_compute(
+        artifact_input: ArtifactVersionInput,
+        *,
+        resolve_next_version: object,
+    ) -> str:
+        assert resolve_next_version is cli._compute_next_version
         assert artifact_input.scheme == ArtifactVersionScheme.semver
         assert artifact_input.version_override == '1.2.3'
         assert artifact_input.is_full_release is True
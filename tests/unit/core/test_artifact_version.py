@@ -14,6 +14,11 @@ from releez.errors import (
 )
 
 
+def _unexpected_next_version() -> str:
+    msg = 'next version should not be computed'
+    raise AssertionError(msg)
+
+
 def test_compute_artifact_version_full_release_uses_override() -> None:
     artifact_input = ArtifactVersionInput(
         scheme=ArtifactVersionScheme.docker,
@@ -24,7 +29,30 @@ def test_compute_artifact_version_full_release_uses_override() -> None:
         build_number=None,
     )
 
-    assert compute_artifact_version(artifact_input) == '1.2.3'
+    result = compute_artifact_version(
+        artifact_input,
+        resolve_next_version=_unexpected_next_version,
+    )
+
+    assert result == '1.2.3'
+
+
+def test_compute_artifact_version_resolves_next_version_without_override() -> None:
+    artifact_input = ArtifactVersionInput(
+        scheme=ArtifactVersionScheme.docker,
+        version_override=None,
+        is_full_release=True,
+        prerelease_type=PrereleaseType.alpha,
+        prerelease_number=None,
+        build_number=None,
+    )
+
+    result = compute_artifact_version(
+        artifact_input,
+        resolve_next_version=lambda: '2.0.0',
+    )
+
+    assert result == '2.0.0'
 
 
 @pytest.mark.parametrize(
@@ -57,7 +85,12 @@ def test_compute_artifact_version_prerelease_formats(
         build_number=456,
     )
 
-    assert compute_artifact_version(artifact_input) == expected
+    result = compute_artifact_version(
+        artifact_input,
+        resolve_next_version=_unexpected_next_version,
+    )
+
+    assert result == expected
 
 
 def test_compute_artifact_version_requires_build_number_for_prerelease() -> None:
@@ -70,8 +103,11 @@ def test_compute_artifact_version_requires_build_number_for_prerelease() -> None
         build_number=None,
     )
 
-    with pytest.raises(BuildNumberRequiredError):
-        compute_artifact_version(artifact_input)
+    with pytest.raises(BuildNumberRequiredError, match='Build number is required'):
+        compute_artifact_version(
+            artifact_input,
+            resolve_next_version=_unexpected_next_version,
+        )
 
 
 def test_compute_artifact_version_requires_prerelease_number_for_prerelease() -> None:
@@ -85,4 +121,24 @@ def test_compute_artifact_version_requires_prerelease_number_for_prerelease() ->
     )
 
     with pytest.raises(PrereleaseNumberRequiredError):
-        compute_artifact_version(artifact_input)
+        compute_artifact_version(
+            artifact_input,
+            resolve_next_version=_unexpected_next_version,
+        )
+
+
+def test_compute_artifact_version_validates_before_resolving_next_version() -> None:
+    artifact_input = ArtifactVersionInput(
+        scheme=ArtifactVersionScheme.docker,
+        version_override=None,
+        is_full_release=False,
+        prerelease_type=PrereleaseType.alpha,
+        prerelease_number=1,
+        build_number=None,
+    )
+
+    with pytest.raises(BuildNumberRequiredError):
+        compute_artifact_version(
+            artifact_input,
+            resolve_next_version=_unexpected_next_version,
+        )
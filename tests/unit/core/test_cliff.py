@@ -2,13 +2,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import pytest
+
 import releez.cliff
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
 
-    import pytest
-
 
 def test_git_cliff_base_cmd_prefers_current_env_scripts_dir(
     monkeypatch: pytest.MonkeyPatch,
@@ -28,7 +29,7 @@ def test_git_cliff_base_cmd_prefers_current_env_scripts_dir(
     )
     monkeypatch.setattr(releez.cliff.shutil, 'which', lambda _: None)
 
-    assert releez.cliff._git_cliff_base_cmd() == [str(exe_path)]
+    assert releez.cliff._git_cliff_base_cmd() == (str(exe_path),)
 
 
 def test_git_cliff_base_cmd_falls_back_to_path(
@@ -41,4 +42,93 @@ def test_git_cliff_base_cmd_falls_back_to_path(
         lambda _: '/usr/bin/git-cliff',
     )
 
-    assert releez.cliff._git_cliff_base_cmd() == ['git-cliff']
+    assert releez.cliff._git_cliff_base_cmd() == ('git-cliff',)
+
+
+def test_git_cliff_base_cmd_is_resolved_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+
+    def _which(name: str) -> str:
+        calls.append(name)
+        return '/usr/bin/git-cliff'
+
+    monkeypatch.setattr(releez.cliff.sysconfig, 'get_path', lambda _: None)
+    monkeypatch.setattr(releez.cliff.shutil, 'which', _which)
+
+    releez.cliff._git_cliff_base_cmd()
+    releez.cliff._git_cliff_base_cmd()
+
+    assert calls == ['git-cliff']
+
+
+def _fake_render(
+    markdown: str,
+    calls: list[list[str]],
+) -> Callable[..., str]:
+    def _run_checked(args: list[str], **_: object) -> str:
+        calls.append(args)
+        return '9.9.9' if '--bumped-version' in args else markdown
+
+    return _run_checked
+
+
+def test_compute_version_and_notes_reads_version_from_heading(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    calls: list[list[str]] = []
+    monkeypatch.setattr(releez.cliff, '_git_cliff_base_cmd', lambda: ('git-cliff',))
+    monkeypatch.setattr(
+        releez.cliff,
+        'run_checked',
+        _fake_render('## [2.3.4] - 2026-01-01\n\n- Change\n', calls),
+    )
+
+    notes = releez.cliff.GitCliff(repo_root=tmp_path).compute_version_and_notes(bump='minor')
+
+    assert notes.version == '2.3.4'
+    assert notes.markdown == '## [2.3.4] - 2026-01-01\n\n- Change\n'
+    assert len(calls) == 1
+    assert calls[0][calls[0].index('--bump') + 1] == 'minor'
+
+
+def test_compute_version_and_notes_falls_back_without_heading(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    calls: list[list[str]] = []
+    monkeypatch.setattr(releez.cliff, '_git_cliff_base_cmd', lambda: ('git-cliff',))
+    monkeypatch.setattr(releez.cliff, 'run_checked', _fake_render('- Change\n', calls))
+
+    notes = releez.cliff.GitCliff(repo_root=tmp_path).compute_version_and_notes(bump='auto')
+
+    assert notes.version == '9.9.9'
+    assert len(calls) == 2
+    assert '--bumped-version' in calls[1]
+
+
+@pytest.mark.parametrize(
+    'markdown',
+    [
+        '## [1.2.3-rc.1] - 2026-01-01\n\n- Change\n',
+        '## Unreleased\n\n# 1.2.3 in a commit body\n',
+    ],
+    ids=['prerelease-heading', 'non-version-first-heading'],
+)
+def test_compute_version_and_notes_falls_back_on_unexpected_heading(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    markdown: str,
+) -> None:
+    calls: list[list[str]] = []
+    monkeypatch.setattr(releez.cliff, '_git_cliff_base_cmd', lambda: ('git-cliff',))
+    monkeypatch.setattr(releez.cliff, 'run_checked', _fake_render(markdown, calls))
+
+    notes = releez.cliff.GitCliff(repo_root=tmp_path).compute_version_and_notes(bump='auto')
+
+    assert notes.version == '9.9.9'
+    assert notes.markdown == markdown
+    assert len(calls) == 2
+    assert '--bumped-version' in calls[1]
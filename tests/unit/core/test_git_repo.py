@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+from git import Actor, Repo
+from git.exc import GitCommandError
+
+from releez.errors import (
+    DirtyWorkingTreeError,
+    ExternalCommandError,
+    GitBranchExistsError,
+    GitRemoteBranchNotFoundError,
+    GitTagExistsError,
+)
+from releez.git_repo import (
+    _locate_repo,
+    checkout_remote_branch,
+    commit_file,
+    create_and_checkout_branch,
+    create_tags,
+    ensure_clean,
+    open_repo,
+    push_refs,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Repo:
+    repo = Repo.init(tmp_path)
+    with repo.config_writer() as config:
+        config.set_value('user', 'name', 'releez')
+        config.set_value('user', 'email', 'releez@example.com')
+    actor = Actor('releez', 'releez@example.com')
+    repo.index.commit('init', author=actor, committer=actor)
+    return repo
+
+
+def test_create_tags_creates_all_tags(repo: Repo) -> None:
+    create_tags(repo, tags=['2.3.4', 'v2', 'v2.3'], force=False)
+
+    assert sorted(t.name for t in repo.tags) == ['2.3.4', 'v2', 'v2.3']
+
+
+def test_create_tags_rejects_existing_tag(repo: Repo) -> None:
+    repo.create_tag('v2')
+
+    with pytest.raises(GitTagExistsError):
+        create_tags(repo, tags=['2.3.4', 'v2'], force=False)
+
+    assert [t.name for t in repo.tags] == ['v2']
+
+
+def test_create_tags_force_moves_existing_tag(repo: Repo) -> None:
+    repo.create_tag('v2')
+    actor = Actor('releez', 'releez@example.com')
+    head = repo.index.commit('next', author=actor, committer=actor)
+
+    create_tags(repo, tags=['v2'], force=True)
+
+    assert repo.tags['v2'].commit == head
+
+
+def test_create_tags_is_all_or_nothing(repo: Repo) -> None:
+    with pytest.raises(ExternalCommandError):
+        create_tags(repo, tags=['2.3.4', 'bad..name'], force=False)
+
+    assert list(repo.tags) == []
+
+
+def test_open_repo_reads_origin_url(repo: Repo, tmp_path: Path) -> None:
+    repo.create_remote('origin', 'git@github.com:org/repo.git')
+
+    _, info = open_repo(cwd=tmp_path)
+
+    assert info.root == tmp_path.resolve()
+    assert info.remote_url == 'git@github.com:org/repo.git'
+
+
+@pytest.mark.usefixtures('repo')
+def test_open_repo_without_origin_has_empty_url(tmp_path: Path) -> None:
+    _, info = open_repo(cwd=tmp_path)
+
+    assert info.remote_url == ''
+
+
+@pytest.mark.usefixtures('repo')
+def test_open_repo_is_memoized_per_working_directory(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    _, first = open_repo()
+    _, second = open_repo(cwd=tmp_path)
+
+    assert first == second
+    assert _locate_repo.cache_info().hits == 1
+
+
+def test_open_repo_reads_active_branch_fresh(repo: Repo, tmp_path: Path) -> None:
+    open_repo(cwd=tmp_path)
+    create_and_checkout_branch(repo, name='release/1.2.3')
+
+    _, info = open_repo(cwd=tmp_path)
+
+    assert info.active_branch == 'release/1.2.3'
+
+
+def test_ensure_clean_accepts_clean_tree(repo: Repo) -> None:
+    ensure_clean(repo)
+
+
+@pytest.mark.parametrize('change', ['untracked', 'staged', 'unstaged'])
+def test_ensure_clean_rejects_dirty_tree(
+    repo: Repo,
+    tmp_path: Path,
+    change: str,
+) -> None:
+    path = tmp_path / 'file.txt'
+    path.write_text('one\n', encoding='utf-8')
+    if change != 'untracked':
+        repo.index.add(['file.txt'])
+    if change == 'unstaged':
+        actor = Actor('releez', 'releez@example.com')
+        repo.index.commit('add file', author=actor, committer=actor)
+        path.write_text('two\n', encoding='utf-8')
+
+    with pytest.raises(DirtyWorkingTreeError):
+        ensure_clean(repo)
+
+
+def test_commit_file_commits_path_under_repo_root(
+    repo: Repo,
+    tmp_path: Path,
+) -> None:
+    changelog = tmp_path / 'CHANGELOG.md'
+    changelog.write_text('# Changelog\n', encoding='utf-8')
+
+    commit_file(repo, repo_root=tmp_path, path=changelog, message='chore: changelog')
+
+    assert repo.head.commit.message.strip() == 'chore: changelog'
+    assert 'CHANGELOG.md' in repo.head.commit.tree
+
+
+def test_commit_file_leaves_other_staged_changes_out(
+    repo: Repo,
+    tmp_path: Path,
+) -> None:
+    changelog = tmp_path / 'CHANGELOG.md'
+    changelog.write_text('# Changelog\n', encoding='utf-8')
+    (tmp_path / 'other.txt').write_text('other\n', encoding='utf-8')
+    repo.index.add(['other.txt'])
+
+    commit_file(repo, repo_root=tmp_path, path=changelog, message='chore: changelog')
+
+    assert 'CHANGELOG.md' in repo.head.commit.tree
+    assert 'other.txt' not in repo.head.commit.tree
+
+
+def test_commit_file_without_configured_identity(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    home = tmp_path / 'home'
+    home.mkdir()
+    monkeypatch.setenv('HOME', str(home))
+    monkeypatch.setenv('GIT_CONFIG_NOSYSTEM', '1')
+    monkeypatch.delenv('XDG_CONFIG_HOME', raising=False)
+    monkeypatch.delenv('EMAIL', raising=False)
+    for var in (
+        'GIT_AUTHOR_NAME',
+        'GIT_AUTHOR_EMAIL',
+        'GIT_COMMITTER_NAME',
+        'GIT_COMMITTER_EMAIL',
+    ):
+        monkeypatch.delenv(var, raising=False)
+    root = tmp_path / 'repo'
+    repo = Repo.init(root)
+    changelog = root / 'CHANGELOG.md'
+    changelog.write_text('# Changelog\n', encoding='utf-8')
+
+    commit_file(repo, repo_root=root, path=changelog, message='chore: changelog')
+
+    assert repo.head.commit.message.strip() == 'chore: changelog'
+    assert repo.head.commit.author.email
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='uses a POSIX shell hook')
+def test_commit_file_runs_commit_hooks(repo: Repo, tmp_path: Path) -> None:
+    hook = tmp_path / '.git' / 'hooks' / 'pre-commit'
+    hook.write_text('#!/bin/sh\nexit 1\n', encoding='utf-8')
+    hook.chmod(0o755)
+    changelog = tmp_path / 'CHANGELOG.md'
+    changelog.write_text('# Changelog\n', encoding='utf-8')
+
+    with pytest.raises(GitCommandError):
+        commit_file(repo, repo_root=tmp_path, path=changelog, message='chore: changelog')
+
+
+def test_checkout_remote_branch_detaches_at_remote_ref(repo: Repo) -> None:
+    repo.git.update_ref('refs/remotes/origin/main', 'HEAD')
+
+    checkout_remote_branch(repo, remote_name='origin', branch='main')
+
+    assert repo.head.is_detached
+
+
+def test_checkout_remote_branch_rejects_missing_ref(
+    repo: Repo,
+    tmp_path: Path,
+) -> None:
+    # A same-named file must not be mistaken for the ref.
+    (tmp_path / 'origin').mkdir()
+    (tmp_path / 'origin' / 'main').write_text('', encoding='utf-8')
+
+    with pytest.raises(GitRemoteBranchNotFoundError):
+        checkout_remote_branch(repo, remote_name='origin', branch='main')
+
+
+def test_create_and_checkout_branch(repo: Repo) -> None:
+    create_and_checkout_branch(repo, name='release/1.2.3')
+
+    assert repo.active_branch.name == 'release/1.2.3'
+
+
+def test_create_and_checkout_branch_rejects_existing_branch(repo: Repo) -> None:
+    repo.create_head('release/1.2.3')
+
+    with pytest.raises(GitBranchExistsError):
+        create_and_checkout_branch(repo, name='release/1.2.3')
+
+
+def test_push_refs_pushes_tags_atomically(repo: Repo, tmp_path: Path) -> None:
+    remote = Repo.init(tmp_path / 'remote.git', bare=True)
+    repo.create_remote('upstream', str(tmp_path / 'remote.git'))
+    repo.create_tag('2.3.4')
+
+    push_refs(repo, remote_name='upstream', tags=['2.3.4'], force_tags=['v2'])
+
+    assert sorted(t.name for t in remote.tags) == ['2.3.4', 'v2']
+    assert remote.tags['v2'].commit == repo.head.commit
+
+
+def test_push_refs_rejects_all_refs_when_one_is_rejected(
+    repo: Repo,
+    tmp_path: Path,
+) -> None:
+    remote = Repo.init(tmp_path / 'remote.git', bare=True)
+    repo.create_remote('upstream', str(tmp_path / 'remote.git'))
+    repo.create_tag('2.3.4')
+    repo.git.push('upstream', 'refs/tags/2.3.4')
+    actor = Actor('releez', 'releez@example.com')
+    repo.index.commit('next', author=actor, committer=actor)
+    repo.create_tag('2.3.4', force=True)
+
+    with pytest.raises(GitCommandError):
+        push_refs(repo, remote_name='upstream', tags=['2.3.4'], force_tags=['v2'])
+
+    assert [t.name for t in remote.tags] == ['2.3.4']
+    assert 'v2' not in repo.tags
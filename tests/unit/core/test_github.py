@@ -1,15 +1,45 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 
+import releez.github
 from releez.errors import InvalidGitHubRemoteError
-from releez.github import _github_api_base_url_from_env, _parse_github_full_name
+from releez.github import (
+    PullRequestCreateRequest,
+    _github_api_base_url_from_env,
+    _parse_github_full_name,
+    create_pull_request,
+)
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
 
 
 def test_parse_github_full_name_https_github_com() -> None:
     assert _parse_github_full_name('https://github.com/org/repo.git') == 'org/repo'
 
 
+@pytest.mark.parametrize(
+    'remote_url',
+    [
+        'git@github.com:org/repo.git',
+        'git@github.com:org/repo',
+        'ssh://git@github.com/org/repo.git',
+        'http://github.com/org/repo',
+        ' https://github.com/org/repo.git\n',
+    ],
+)
+def test_parse_github_full_name_remote_url_forms(remote_url: str) -> None:
+    assert _parse_github_full_name(remote_url) == 'org/repo'
+
+
+def test_parse_github_full_name_rejects_non_repo_paths() -> None:
+    with pytest.raises(InvalidGitHubRemoteError):
+        _parse_github_full_name('https://github.com/org/repo/tree/main')
+
+
 def test_parse_github_full_name_supports_github_server_url_env(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -39,3 +69,55 @@ def test_github_api_base_url_derives_from_server_url(
     monkeypatch.delenv('GITHUB_API_URL', raising=False)
     monkeypatch.setenv('GITHUB_SERVER_URL', 'https://ghe.example.com/')
     assert _github_api_base_url_from_env() == 'https://ghe.example.com/api/v3'
+
+
+def test_github_api_base_url_follows_env_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv('RELEEZ_GITHUB_API_URL', raising=False)
+    monkeypatch.delenv('RELEEZ_GITHUB_SERVER_URL', raising=False)
+    monkeypatch.setenv('GITHUB_API_URL', 'https://one.example.com/api/v3')
+    assert _github_api_base_url_from_env() == 'https://one.example.com/api/v3'
+
+    monkeypatch.setenv('GITHUB_API_URL', 'https://two.example.com/api/v3')
+    assert _github_api_base_url_from_env() == 'https://two.example.com/api/v3'
+
+
+def test_create_pull_request_reuses_client(
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    for var in releez.github._GITHUB_URL_ENV_VARS:
+        monkeypatch.delenv(var, raising=False)
+    github_cls = mocker.patch('github.Github')
+    request = PullRequestCreateRequest(
+        remote_url='git@github.com:org/repo.git',
+        token='token',
+        base='master',
+        head='release/1.2.3',
+        title='chore(release): 1.2.3',
+        body='notes',
+        labels=['release'],
+    )
+
+    create_pull_request(request)
+    create_pull_request(request)
+
+    github_cls.assert_called_once_with('token', lazy=True)
+    repo = github_cls.return_value.get_repo.return_value
+    assert repo.create_pull.call_count == 2
+    repo.create_pull.return_value.add_to_labels.assert_called_with('release')
+
+
+def test_github_client_is_rebuilt_for_a_new_token(mocker: MockerFixture) -> None:
+    github_cls = mocker.patch('github.Github')
+
+    releez.github._github_client('one', None)
+    releez.github._github_client('two', None)
+
+    assert github_cls.call_args_list == [
+        mocker.call('one', lazy=True),
+        mocker.call('two', lazy=True),
+    ]
+    assert len(releez.github._GITHUB_CLIENTS) == 1
+    assert not any('two' in key for key in releez.github._GITHUB_CLIENTS)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+import releez.next_version_cache
+from releez.next_version_cache import _fingerprint, get_or_compute
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+def _counting_compute(version: str) -> tuple[list[str], Callable[[], str]]:
+    calls: list[str] = []
+
+    def _compute() -> str:
+        calls.append(version)
+        return version
+
+    return calls, _compute
+
+
+def test_get_or_compute_reuses_version_for_same_fingerprint(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    (tmp_path / '.git').mkdir()
+    monkeypatch.setattr(releez.next_version_cache, '_fingerprint', lambda _: 'abc')
+    calls, compute = _counting_compute('1.2.3')
+
+    first = get_or_compute(repo_root=tmp_path, bump='auto', compute=compute)
+    second = get_or_compute(repo_root=tmp_path, bump='auto', compute=compute)
+
+    assert first == second == '1.2.3'
+    assert calls == ['1.2.3']
+    assert (tmp_path / '.git' / 'releez' / 'next_version.json').is_file()
+
+
+def test_get_or_compute_recomputes_when_fingerprint_changes(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    (tmp_path / '.git').mkdir()
+    monkeypatch.setattr(releez.next_version_cache, '_fingerprint', lambda _: 'abc')
+    calls, compute = _counting_compute('1.2.3')
+    get_or_compute(repo_root=tmp_path, bump='auto', compute=compute)
+
+    monkeypatch.setattr(releez.next_version_cache, '_fingerprint', lambda _: 'def')
+    get_or_compute(repo_root=tmp_path, bump='auto', compute=compute)
+    get_or_compute(repo_root=tmp_path, bump='major', compute=compute)
+
+    assert len(calls) == 3
+
+
+def test_get_or_compute_skips_cache_without_git_dir(tmp_path: Path) -> None:
+    calls, compute = _counting_compute('1.2.3')
+
+    get_or_compute(repo_root=tmp_path, bump='auto', compute=compute)
+    get_or_compute(repo_root=tmp_path, bump='auto', compute=compute)
+
+    assert len(calls) == 2
+    assert not (tmp_path / '.git').exists()
+
+
+def _stub_git(monkeypatch: pytest.MonkeyPatch, *, cliff_version: str = 'git-cliff 2.14.2') -> None:
+    monkeypatch.setattr(releez.next_version_cache, 'run_checked', lambda *_, **__: 'abc HEAD')
+    monkeypatch.setattr(releez.next_version_cache, 'git_cliff_version', lambda: cliff_version)
+
+
+@pytest.mark.parametrize(
+    'config_file',
+    [
+        'cliff.toml',
+        '.cliff.toml',
+        '.config/cliff.toml',
+        'pyproject.toml',
+        'Cargo.toml',
+        'xdg/git-cliff/cliff.toml',
+    ],
+)
+def test_fingerprint_tracks_every_git_cliff_config_location(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    config_file: str,
+) -> None:
+    _stub_git(monkeypatch)
+    monkeypatch.setenv('XDG_CONFIG_HOME', str(tmp_path / 'xdg'))
+    config = tmp_path / config_file
+    config.parent.mkdir(parents=True, exist_ok=True)
+    config.write_text('[changelog]\n', encoding='utf-8')
+    before = _fingerprint(tmp_path)
+
+    config.write_text('[changelog]\nheader = "changed"\n', encoding='utf-8')
+
+    assert _fingerprint(tmp_path) != before
+
+
+def test_fingerprint_tracks_git_cliff_version(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    _stub_git(monkeypatch, cliff_version='git-cliff 2.14.2')
+    before = _fingerprint(tmp_path)
+
+    _stub_git(monkeypatch, cliff_version='git-cliff 2.15.0')
+
+    assert _fingerprint(tmp_path) != before
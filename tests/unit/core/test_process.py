@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from releez.errors import ExternalCommandError, MissingCliError
+from releez.process import run_checked, run_probe
+
+
+def test_run_probe_returns_non_zero_exit() -> None:
+    probe = run_probe([sys.executable, '-c', 'import sys; print("no"); sys.exit(3)'])
+
+    assert probe.returncode == 3
+    assert probe.stdout == 'no'
+    assert not probe.ok
+
+
+def test_run_probe_raises_for_missing_executable() -> None:
+    with pytest.raises(MissingCliError):
+        run_probe(['releez-definitely-missing-cli'])
+
+
+def test_run_checked_raises_on_non_zero_exit() -> None:
+    with pytest.raises(ExternalCommandError, match='boom'):
+        run_checked(
+            [sys.executable, '-c', 'import sys; sys.stderr.write("boom"); sys.exit(1)'],
+        )
+
+
+def test_run_checked_feeds_stdin() -> None:
+    out = run_checked(
+        [sys.executable, '-c', 'import sys; print(sys.stdin.read().upper())'],
+        stdin='tag\n',
+    )
+
+    assert out == 'TAG'
@@ -2,7 +2,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import pytest
+
 import releez.release
+from releez.cliff import ReleaseNotes
+from releez.errors import DirtyWorkingTreeError
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -24,13 +28,15 @@ def test_start_release_runs_changelog_format_command(
     mocker.patch('releez.release.fetch')
     mocker.patch('releez.release.checkout_remote_branch')
     mocker.patch('releez.release.create_and_checkout_branch')
-    mocker.patch('releez.release.commit_file')
+    commit_file = mocker.patch('releez.release.commit_file')
     mocker.patch('releez.release.push_set_upstream')
     mocker.patch('releez.release._maybe_create_pull_request', return_value=None)
 
     cliff = mocker.Mock()
-    cliff.compute_next_version.return_value = '1.2.3'
-    cliff.generate_unreleased_notes.return_value = 'notes'
+    cliff.compute_version_and_notes.return_value = ReleaseNotes(
+        version='1.2.3',
+        markdown='notes',
+    )
     mocker.patch('releez.release.GitCliff', return_value=cliff)
 
     run_checked = mocker.patch('releez.release.run_checked', return_value='')
@@ -56,9 +62,55 @@ def test_start_release_runs_changelog_format_command(
         version='1.2.3',
         changelog_path=changelog,
     )
+    commit_file.assert_called_once_with(
+        repo,
+        repo_root=tmp_path,
+        path=changelog,
+        message='chore(release): 1.2.3',
+    )
     run_checked.assert_called_once_with(
         ['dprint', 'fmt', str(changelog)],
         cwd=tmp_path,
         capture_stdout=False,
     )
     assert result.version == '1.2.3'
+    assert result.release_notes_markdown == 'notes'
+    cliff.compute_version_and_notes.assert_called_once_with(bump='auto')
+    cliff.generate_unreleased_notes.assert_not_called()
+
+
+def test_start_release_dirty_tree_fails_before_fetch(
+    mocker: MockerFixture,
+) -> None:
+    repo = mocker.Mock()
+    mocker.patch(
+        'releez.release.open_repo',
+        return_value=(repo, mocker.Mock(root=None)),
+    )
+    mocker.patch(
+        'releez.release.ensure_clean',
+        side_effect=DirtyWorkingTreeError,
+    )
+    fetch = mocker.patch('releez.release.fetch')
+    git_cliff = mocker.patch('releez.release.GitCliff')
+
+    with pytest.raises(DirtyWorkingTreeError):
+        releez.release.start_release(
+            releez.release.StartReleaseInput(
+                bump='auto',
+                version_override=None,
+                base_branch='master',
+                remote_name='origin',
+                labels=[],
+                title_prefix='chore(release): ',
+                changelog_path='CHANGELOG.md',
+                run_changelog_format=False,
+                changelog_format_cmd=None,
+                create_pr=False,
+                github_token=None,
+                dry_run=True,
+            ),
+        )
+
+    fetch.assert_not_called()
+    git_cliff.assert_not_called()
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from releez.settings import ReleezSettings
+from releez.settings import ReleezSettings, load_settings
 from releez.version_tags import AliasVersions
 
 if TYPE_CHECKING:
@@ -67,3 +67,23 @@ def test_settings_env_vars_override_pyproject_config(
 
     settings = ReleezSettings()
     assert settings.hooks.changelog_format == ['dprint', 'fmt', '{changelog}']
+
+
+def test_load_settings_reuses_load_until_inputs_change(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv('RELEEZ_GIT_REMOTE', raising=False)
+    config = tmp_path / 'releez.toml'
+    config.write_text('git_remote = "upstream"\n', encoding='utf-8')
+
+    first = load_settings()
+    assert load_settings() is first
+    assert first.git_remote == 'upstream'
+
+    config.write_text('git_remote = "mirror-remote"\n', encoding='utf-8')
+    assert load_settings().git_remote == 'mirror-remote'
+
+    monkeypatch.setenv('RELEEZ_GIT_REMOTE', 'from-env')
+    assert load_settings().git_remote == 'from-env'
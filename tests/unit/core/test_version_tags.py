@@ -3,7 +3,12 @@ from __future__ import annotations
 import pytest
 
 from releez.errors import InvalidReleaseVersionError
-from releez.version_tags import compute_version_tags
+from releez.version_tags import (
+    AliasVersions,
+    VersionTags,
+    compute_version_tags,
+    select_tags,
+)
 
 
 def test_compute_version_tags_exact_never_v_prefixed() -> None:
@@ -21,9 +26,23 @@ def test_compute_version_tags_exact_never_v_prefixed() -> None:
         '2.3.4-rc.1',
         '2.3.4+99',
         'v2.3',
+        '02.3.4',
         'not-a-version',
     ],
 )
 def test_compute_version_tags_rejects_invalid_versions(version: str) -> None:
     with pytest.raises(InvalidReleaseVersionError):
         compute_version_tags(version=version)
+
+
+def test_compute_version_tags_zero_components() -> None:
+    tags = compute_version_tags(version='0.10.0')
+    assert tags == VersionTags(exact='0.10.0', major='v0', minor='v0.10')
+
+
+def test_select_tags_returns_reusable_tuples() -> None:
+    tags = compute_version_tags(version='2.3.4')
+
+    assert compute_version_tags(version='2.3.4') is tags
+    assert select_tags(tags=tags, aliases=AliasVersions.none) == ('2.3.4',)
+    assert select_tags(tags=tags, aliases=AliasVersions.minor) == ('2.3.4', 'v2', 'v2.3')